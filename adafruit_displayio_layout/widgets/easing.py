@@ -73,12 +73,36 @@ Implementation Notes
 #
 # Note:  Some functions return values < 0.0 or > 1.0 due "springiness".
 
-import math
+from math import cos, pi, sin, sqrt
+
+try:
+    from typing import Callable
+except ImportError:
+    pass
 
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_DisplayIO_Layout.git"
 
+# Quarter-cycle phase scale shared by the sine easings
+_HALF_PI = pi / 2
+
+# Angular frequencies of the elastic easings' damped sine waves
+_ELASTIC_K = 13 * pi / 2
+_ELASTIC_K2 = 13 * pi
+
+# Segment upper bounds and (a, b, c) coefficients of the bounce_easeout
+# parabolas, each evaluated as y = (a*x + b)*x + c
+_BOUNCE_BOUND0 = 4 / 11.0
+_BOUNCE_BOUND1 = 8 / 11.0
+_BOUNCE_BOUND2 = 9 / 10.0
+_BOUNCE_COEFFS = (
+    (121 / 16.0, 0.0, 0.0),
+    (363 / 40.0, -99 / 10.0, 17 / 5.0),
+    (4356 / 361.0, -35442 / 1805.0, 16061 / 1805.0),
+    (54 / 5.0, -513 / 25.0, 268 / 25.0),
+)
+
 
 # Modeled after the line y = x
 def linear_interpolation(pos: float) -> float:
@@ -113,7 +137,7 @@ def quadratic_easeinout(pos: float) -> float:
     """
     if pos < 0.5:
         return 2 * pos * pos
-    return (-2 * pos * pos) + (4 * pos) - 1
+    return (4 - 2 * pos) * pos - 1
 
 
 # Modeled after the cubic y = x^3
@@ -151,7 +175,8 @@ def quartic_easein(pos: float) -> float:
     """
     Easing function for animations: Quartic Ease In
     """
-    return pos * pos * pos * pos
+    pos2 = pos * pos
+    return pos2 * pos2
 
 
 # Modeled after the quartic y = 1 - (x - 1)^4
@@ -160,7 +185,8 @@ def quartic_easeout(pos: float) -> float:
     Easing function for animations: Quartic Ease Out
     """
     fos = pos - 1
-    return fos * fos * fos * (1 - pos) + 1
+    fos2 = fos * fos
+    return 1 - fos2 * fos2
 
 
 # Modeled after the piecewise quartic
@@ -171,9 +197,11 @@ def quartic_easeinout(pos: float) -> float:
     Easing function for animations: Quartic Ease In & Out
     """
     if pos < 0.5:
-        return 8 * pos * pos * pos * pos
+        pos2 = pos * pos
+        return 8 * pos2 * pos2
     fos = pos - 1
-    return -8 * fos * fos * fos * fos + 1
+    fos2 = fos * fos
+    return 1 - 8 * fos2 * fos2
 
 
 # Modeled after the quintic y = x^5
@@ -181,7 +209,8 @@ def quintic_easein(pos: float) -> float:
     """
     Easing function for animations: Quintic Ease In
     """
-    return pos * pos * pos * pos * pos
+    pos2 = pos * pos
+    return pos2 * pos2 * pos
 
 
 # Modeled after the quintic y = (x - 1)^5 + 1
@@ -190,7 +219,8 @@ def quintic_easeout(pos: float) -> float:
     Easing function for animations: Quintic Ease Out
     """
     fos = pos - 1
-    return fos * fos * fos * fos * fos + 1
+    fos2 = fos * fos
+    return fos2 * fos2 * fos + 1
 
 
 # Modeled after the piecewise quintic
@@ -201,9 +231,11 @@ def quintic_easeinout(pos: float) -> float:
     Easing function for animations: Quintic Ease In & Out
     """
     if pos < 0.5:
-        return 16 * pos * pos * pos * pos * pos
+        pos2 = pos * pos
+        return 16 * pos2 * pos2 * pos
     fos = (2 * pos) - 2
-    return 0.5 * fos * fos * fos * fos * fos + 1
+    fos2 = fos * fos
+    return 0.5 * fos2 * fos2 * fos + 1
 
 
 # Modeled after quarter-cycle of sine wave
@@ -211,7 +243,7 @@ def sine_easein(pos: float) -> float:
     """
     Easing function for animations: Sine Ease In
     """
-    return math.sin((pos - 1) * math.pi / 2) + 1
+    return 1 - cos(pos * _HALF_PI)
 
 
 # Modeled after quarter-cycle of sine wave (different phase)
@@ -219,7 +251,7 @@ def sine_easeout(pos: float) -> float:
     """
     Easing function for animations: Sine Ease Out
     """
-    return math.sin(pos * math.pi / 2)
+    return sin(pos * _HALF_PI)
 
 
 # Modeled after half sine wave
@@ -227,7 +259,7 @@ def sine_easeinout(pos: float) -> float:
     """
     Easing function for animations: Sine Ease In & Out
     """
-    return 0.5 * (1 - math.cos(pos * math.pi))
+    return 0.5 * (1 - cos(pos * pi))
 
 
 # Modeled after shifted quadrant IV of unit circle
@@ -235,7 +267,7 @@ def circular_easein(pos: float) -> float:
     """
     Easing function for animations: Circular Ease In
     """
-    return 1 - math.sqrt(1 - (pos * pos))
+    return 1 - sqrt(1 - (pos * pos))
 
 
 # Modeled after shifted quadrant II of unit circle
@@ -243,7 +275,7 @@ def circular_easeout(pos: float) -> float:
     """
     Easing function for animations: Circular Ease Out
     """
-    return math.sqrt((2 - pos) * pos)
+    return sqrt((2 - pos) * pos)
 
 
 # Modeled after the piecewise circular function
@@ -254,8 +286,8 @@ def circular_easeinout(pos: float) -> float:
     Easing function for animations: Circular Ease In & Out
     """
     if pos < 0.5:
-        return 0.5 * (1 - math.sqrt(1 - 4 * (pos * pos)))
-    return 0.5 * (math.sqrt(-((2 * pos) - 3) * ((2 * pos) - 1)) + 1)
+        return 0.5 * (1 - sqrt(1 - 4 * (pos * pos)))
+    return 0.5 * (sqrt(-((2 * pos) - 3) * ((2 * pos) - 1)) + 1)
 
 
 # Modeled after the exponential function y = 2^(10(x - 1))
@@ -265,7 +297,7 @@ def exponential_easein(pos: float) -> float:
     """
     if pos == 0:
         return pos
-    return math.pow(2, 10 * (pos - 1))
+    return 2.0 ** (10 * (pos - 1))
 
 
 # Modeled after the exponential function y = -2^(-10x) + 1
@@ -275,7 +307,7 @@ def exponential_easeout(pos: float) -> float:
     """
     if pos == 1:
         return pos
-    return 1 - math.pow(2, -10 * pos)
+    return 1 - 2.0 ** (-10 * pos)
 
 
 # Modeled after the piecewise exponential
@@ -288,8 +320,8 @@ def exponential_easeinout(pos: float) -> float:
     if pos in (0.0, 1.0):
         return pos
     if pos < 0.5:
-        return 0.5 * math.pow(2, (20 * pos) - 10)
-    return (-0.5 * math.pow(2, (-20 * pos) + 10)) + 1
+        return 0.5 * 2.0 ** ((20 * pos) - 10)
+    return (-0.5 * 2.0 ** ((-20 * pos) + 10)) + 1
 
 
 # Modeled after the damped sine wave y = sin(13pi/2*x)*pow(2, 10 * (x - 1))
@@ -297,7 +329,7 @@ def elastic_easein(pos: float) -> float:
     """
     Easing function for animations: Elastic Ease In
     """
-    return math.sin(13 * pos * math.pi / 2) * math.pow(2, 10 * (pos - 1))
+    return sin(_ELASTIC_K * pos) * 2.0 ** (10 * (pos - 1))
 
 
 # Modeled after the damped sine wave y = sin(-13pi/2*(x + 1))*pow(2, -10x) + 1
@@ -305,7 +337,7 @@ def elastic_easeout(pos: float) -> float:
     """
     Easing function for animations: Elastic Ease Out
     """
-    return math.sin(-13 * math.pi / 2 * (pos + 1)) * math.pow(2, -10 * pos) + 1
+    return sin(-_ELASTIC_K * (pos + 1)) * 2.0 ** (-10 * pos) + 1
 
 
 # Modeled after the piecewise exponentially-damped sine wave:
@@ -315,12 +347,10 @@ def elastic_easeinout(pos: float) -> float:
     """
     Easing function for animations: Elastic Ease In & Out
     """
+    fos = 2 * pos - 1
     if pos < 0.5:
-        return 0.5 * math.sin(13 * math.pi * pos) * math.pow(2, 10 * ((2 * pos) - 1))
-    return 0.5 * (
-        math.sin(-13 * math.pi / 2 * ((2 * pos - 1) + 1)) * pow(2, -10 * (2 * pos - 1))
-        + 2
-    )
+        return 0.5 * sin(_ELASTIC_K2 * pos) * 2.0 ** (10 * fos)
+    return 0.5 * (sin(-_ELASTIC_K2 * pos) * 2.0 ** (-10 * fos) + 2)
 
 
 # Modeled after the overshooting cubic y = x^3-x*sin(x*pi)
@@ -328,7 +358,7 @@ def back_easein(pos: float) -> float:
     """
     Easing function for animations: Back Ease In
     """
-    return pos * pos * pos - pos * math.sin(pos * math.pi)
+    return pos * pos * pos - pos * sin(pos * pi)
 
 
 # Modeled after overshooting cubic y = 1-((1-x)^3-(1-x)*sin((1-x)*pi))
@@ -337,7 +367,7 @@ def back_easeout(pos: float) -> float:
     Easing function for animations: Back Ease Out
     """
     fos = 1 - pos
-    return 1 - (fos * fos * fos - fos * math.sin(fos * math.pi))
+    return 1 - (fos * fos * fos - fos * sin(fos * pi))
 
 
 # Modeled after the piecewise overshooting cubic function:
@@ -349,9 +379,9 @@ def back_easeinout(pos: float) -> float:
     """
     if pos < 0.5:
         fos = 2 * pos
-        return 0.5 * (fos * fos * fos - fos * math.sin(fos * math.pi))
+        return 0.5 * (fos * fos * fos - fos * sin(fos * pi))
     fos = 1 - (2 * pos - 1)
-    return 0.5 * (1 - (fos * fos * fos - fos * math.sin(fos * math.pi))) + 0.5
+    return 0.5 * (1 - (fos * fos * fos - fos * sin(fos * pi))) + 0.5
 
 
 def bounce_easein(pos: float) -> float:
@@ -365,13 +395,16 @@ def bounce_easeout(pos: float) -> float:
     """
     Easing function for animations: Bounce Ease Out
     """
-    if pos < 4 / 11.0:
-        return (121 * pos * pos) / 16.0
-    if pos < 8 / 11.0:
-        return (363 / 40.0 * pos * pos) - (99 / 10.0 * pos) + (17 / 5.0)
-    if pos < 9 / 10.0:
-        return (4356 / 361.0 * pos * pos) - (35442 / 1805.0 * pos) + 16061 / 1805.0
-    return (54 / 5.0 * pos * pos) - (513 / 25.0 * pos) + 268 / 25.0
+    if pos < _BOUNCE_BOUND0:
+        segment = 0
+    elif pos < _BOUNCE_BOUND1:
+        segment = 1
+    elif pos < _BOUNCE_BOUND2:
+        segment = 2
+    else:
+        segment = 3
+    coeff_a, coeff_b, coeff_c = _BOUNCE_COEFFS[segment]
+    return (coeff_a * pos + coeff_b) * pos + coeff_c
 
 
 def bounce_easeinout(pos: float) -> float:
@@ -379,5 +412,118 @@ def bounce_easeinout(pos: float) -> float:
     Easing function for animations: Bounce Ease In & Out
     """
     if pos < 0.5:
-        return 0.5 * bounce_easein(pos * 2)
+        return 0.5 - 0.5 * bounce_easeout(1 - 2 * pos)
     return 0.5 * bounce_easeout(pos * 2 - 1) + 0.5
+
+
+def make_memoized(
+    function: Callable[[float], float], bits: int = 8
+) -> Callable[[float], float]:
+    """
+    Wraps an easing function with a cache of its results. The input position is
+    quantized to steps of 1/2^bits, so animations that sample the same positions
+    over and over reuse the cached values instead of recomputing them.
+
+    :param function: the easing function to wrap
+    :param int bits: resolution of the position quantization, in bits (default is 8)
+    :return: the memoized easing function
+    """
+    cache = {}
+    scale = 1 << bits
+
+    def memoized(pos: float) -> float:
+        key = round(pos * scale)
+        value = cache.get(key)
+        if value is None:
+            value = function(key / scale)
+            cache[key] = value
+        return value
+
+    return memoized
+
+
+class EasingKind:  # pylint: disable=too-few-public-methods
+    """
+    Index of each easing function in the dispatch table used by `ease`.
+    """
+
+    LINEAR_INTERPOLATION = 0
+    QUADRATIC_EASEIN = 1
+    QUADRATIC_EASEOUT = 2
+    QUADRATIC_EASEINOUT = 3
+    CUBIC_EASEIN = 4
+    CUBIC_EASEOUT = 5
+    CUBIC_EASEINOUT = 6
+    QUARTIC_EASEIN = 7
+    QUARTIC_EASEOUT = 8
+    QUARTIC_EASEINOUT = 9
+    QUINTIC_EASEIN = 10
+    QUINTIC_EASEOUT = 11
+    QUINTIC_EASEINOUT = 12
+    SINE_EASEIN = 13
+    SINE_EASEOUT = 14
+    SINE_EASEINOUT = 15
+    CIRCULAR_EASEIN = 16
+    CIRCULAR_EASEOUT = 17
+    CIRCULAR_EASEINOUT = 18
+    EXPONENTIAL_EASEIN = 19
+    EXPONENTIAL_EASEOUT = 20
+    EXPONENTIAL_EASEINOUT = 21
+    ELASTIC_EASEIN = 22
+    ELASTIC_EASEOUT = 23
+    ELASTIC_EASEINOUT = 24
+    BACK_EASEIN = 25
+    BACK_EASEOUT = 26
+    BACK_EASEINOUT = 27
+    BOUNCE_EASEIN = 28
+    BOUNCE_EASEOUT = 29
+    BOUNCE_EASEINOUT = 30
+
+
+# Dispatch table for `ease`, in `EasingKind` order
+_EASING_TABLE = (
+    linear_interpolation,
+    quadratic_easein,
+    quadratic_easeout,
+    quadratic_easeinout,
+    cubic_easein,
+    cubic_easeout,
+    cubic_easeinout,
+    quartic_easein,
+    quartic_easeout,
+    quartic_easeinout,
+    quintic_easein,
+    quintic_easeout,
+    quintic_easeinout,
+    sine_easein,
+    sine_easeout,
+    sine_easeinout,
+    circular_easein,
+    circular_easeout,
+    circular_easeinout,
+    exponential_easein,
+    exponential_easeout,
+    exponential_easeinout,
+    elastic_easein,
+    elastic_easeout,
+    elastic_easeinout,
+    back_easein,
+    back_easeout,
+    back_easeinout,
+    bounce_easein,
+    bounce_easeout,
+    bounce_easeinout,
+)
+
+
+def ease(kind: int, pos: float) -> float:
+    """
+    Evaluates the easing function selected by index. Selecting the easing with an
+    `EasingKind` value is a single table lookup, cheaper than looking up the
+    function by name on every frame.
+
+    :param int kind: the `EasingKind` index of the easing function
+    :param float pos: the input position, from 0.0 to 1.0
+    :return: the eased position
+    """
+    return _EASING_TABLE[kind](pos)
@@ -21,13 +21,11 @@ Implementation Notes
 
 """
 
-import gc
 import time
 import displayio
+import bitmaptools
 from terminalio import FONT
 
-from adafruit_display_shapes.triangle import Triangle
-
 from adafruit_display_text import bitmap_label
 from adafruit_displayio_layout.widgets.widget import Widget
 from adafruit_displayio_layout.widgets.control import Control
@@ -47,6 +45,11 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_DisplayIO_Layout.git"
 
+# target frame rate for the flip animation
+_TARGET_FPS = 30
+
+_monotonic = time.monotonic  # bound once, used on every touch
+
 
 # pylint: disable=too-many-arguments, too-many-branches, too-many-statements
 # pylint: disable=too-many-locals, too-many-instance-attributes
@@ -83,6 +86,7 @@ class FlipInput(Widget, Control):
      direction, set `False` for arrows in the vertical direction (default = `True`)
     :param float animation_time: duration for the animation during flipping between
      values, in seconds (default is 0.4 seconds), set to 0.0 or `None` for no animation.
+     Durations too short for two animation frames are also not animated.
     :param float cool_down: minimum duration between activations of the widget with a
      continuous pressing, this can be used to reduce the chance of accidental multiple
      activations, in seconds (default is 0.0 seconds, no delay).  Set to -1.0 to require
@@ -114,10 +118,9 @@ class FlipInput(Widget, Control):
     ) -> None:
         super().__init__(**kwargs)
         # Group elements for the FlipInput.
-        # 0. The text
-        # 1. The group holding the temporary scroll bitmap
-        # 2. Up arrow: Triangle
-        # 3. Down arrow: Triangle
+        # 0. The group holding the value bitmap
+        # 1. Up arrow: Triangle
+        # 2. Down arrow: Triangle
 
         # initialize the Control superclass
 
@@ -125,6 +128,7 @@ class FlipInput(Widget, Control):
         super(Control, self).__init__()
 
         self.value_list = value_list
+        self._value_count = len(value_list)
         self._value = value
 
         self._color = color
@@ -140,61 +144,78 @@ class FlipInput(Widget, Control):
 
         self._animation_time = animation_time
         self._cool_down = cool_down
-        self._last_pressed = time.monotonic()
+        self._last_pressed = _monotonic()
         self._pressed = False  # state variable
 
         # Find the maximum bounding box of the text and determine the
         # baseline (x,y) start point (top, left)
 
-        left = None
-        right = None
-        top = None
-        bottom = None
+        # look up each distinct character once, loading all the glyphs at once
+        # for fonts that load glyphs on demand, and keep only the metrics needed
+        characters = "".join(value_list)
+        if hasattr(self._font, "load_glyphs"):
+            self._font.load_glyphs(characters)
+        get_glyph = self._font.get_glyph
+        glyph_metrics = {}
+        for character in set(characters):
+            glyph = get_glyph(ord(character))
+            glyph_metrics[character] = (
+                glyph.dx,
+                glyph.dy,
+                glyph.width,
+                glyph.height,
+                glyph.shift_x,
+            )
+
+        # Something is wrong if there are no glyphs in the value_list
+        assert characters
+
+        # start the extents from the first glyph of the first non-empty value
+        (
+            glyph_dx,
+            glyph_dy,
+            glyph_width,
+            glyph_height,
+            glyph_shift_x,
+        ) = glyph_metrics[characters[0]]
+        left = glyph_dx
+        right = glyph_dx + glyph_width  # the loop below also checks shift_x
+        top = -(glyph_height + glyph_dy)
+        bottom = -glyph_dy
 
         for this_value in value_list:
             xposition = 0
 
             for i, character in enumerate(this_value):
-                glyph = self._font.get_glyph(ord(character))
-
-                if (
-                    i == 0
-                ):  # if it's the first character in the string, check the left value
-                    if left is None:
-                        left = glyph.dx
-                    else:
-                        left = min(left, glyph.dx)
-
-                if right is None:
-                    right = max(
-                        xposition + glyph.dx + glyph.width, xposition + glyph.shift_x
-                    )
-                else:
-                    right = max(
-                        right,
-                        xposition + glyph.dx + glyph.width,
-                        xposition + glyph.shift_x,
-                    )  # match bitmap_label
-
-                if top is None:
-                    top = -(glyph.height + glyph.dy)
-                else:
-                    top = min(top, -(glyph.height + glyph.dy))
-
-                if bottom is None:
-                    bottom = -glyph.dy
-                else:
-                    bottom = max(bottom, -glyph.dy)
-
-                xposition = xposition + glyph.shift_x
-
-        # Something is wrong if left, right, top, or bottom are still None here
-        assert (
-            right is not None
-            and left is not None
-            and top is not None
-            and bottom is not None
-        )
+                (
+                    glyph_dx,
+                    glyph_dy,
+                    glyph_width,
+                    glyph_height,
+                    glyph_shift_x,
+                ) = glyph_metrics[character]
+
+                # if it's the first character in the string, check the left value
+                if i == 0 and glyph_dx < left:
+                    left = glyph_dx
+
+                # match bitmap_label: the right edge is the further of the
+                # glyph's ink and its advance
+                glyph_right = xposition + glyph_dx + glyph_width
+                if glyph_right > right:
+                    right = glyph_right
+                glyph_right = xposition + glyph_shift_x
+                if glyph_right > right:
+                    right = glyph_right
+
+                glyph_top = -(glyph_height + glyph_dy)
+                if glyph_top < top:
+                    top = glyph_top
+
+                if -glyph_dy > bottom:
+                    bottom = -glyph_dy
+
+                xposition = xposition + glyph_shift_x
 
         self._bounding_box = [
             0,
@@ -203,22 +224,26 @@ class FlipInput(Widget, Control):
             (bottom - top) * self._font_scale,
         ]
 
-        # Create the text label
-        self._label = bitmap_label.Label(
-            text=value_list[value],
-            font=self._font,
-            scale=self._font_scale,
-            color=self._color,
-            base_alignment=True,
-            background_tight=True,
-        )
-        self._label.x = -1 * left * self._font_scale
-        self._label.y = -1 * top * self._font_scale
-
         self._left = left
         self._top = top
 
-        self.append(self._label)  # add the label to the self Group
+        # Only the current value is kept rendered, in a bitmap sized to the
+        # bounding box, other values are rendered when they are flipped to
+        self._value_bitmap = displayio.Bitmap(right - left, bottom - top, 2)
+        self._render_value(value, self._value_bitmap)
+
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._palette[1] = self._color
+
+        # Create the tilegrid that displays the current value
+        self._value_tilegrid = displayio.TileGrid(
+            self._value_bitmap, pixel_shader=self._palette
+        )
+        self._value_group = displayio.Group(scale=self._font_scale)
+        self._value_group.append(self._value_tilegrid)
+
+        self.append(self._value_group)  # add the value group to the self Group
 
         # set the touch_boundary including the touch_padding
         self._arrow_gap = arrow_gap  # of pixel gap above/below label before the arrow
@@ -247,197 +272,186 @@ class FlipInput(Widget, Control):
                 self._bounding_box[3]
                 + 2 * (self._arrow_gap + arrow_height + self._arrow_touch_padding),
             )
+        self._split_touch_boundary()
 
         # create the Up/Down arrows
         self._update_position()  # call Widget superclass function to reposition
 
-        self._animation_group = displayio.Group(
-            scale=self._font_scale
-        )  # holds the animation bitmap
-        # self._animation_group.x = -1 * left * (1)
-        # self._animation_group.y = -1 * top * (1)
-        self._animation_group.hidden = True
-        self.append(self._animation_group)
+        # only animate if there is time for at least two frames
+        self._animated = (animation_time is not None) and (
+            int(animation_time * _TARGET_FPS) >= 2
+        )
+
+        # precompute the eased scroll positions of the animation frames, for
+        # flipping to the next and to the previous value, and create the bitmaps
+        # for the new value and for the animation to be drawn into
+        if self._animated:
+            self._next_positions = _eased_positions(0.0, 1.0, animation_time)
+            self._previous_positions = _eased_positions(1.0, 0.0, animation_time)
+            self._spare_bitmap = displayio.Bitmap(right - left, bottom - top, 2)
+            self._animation_bitmap = displayio.Bitmap(
+                right - left, bottom - top, 2
+            )  # color depth 2
 
         # Add the two arrow triangles, if required
 
         if (arrow_color is not None) or (arrow_outline is not None):
+            # only import the shapes library when arrows are drawn
+            # pylint: disable=import-outside-toplevel
+            from adafruit_display_shapes.triangle import Triangle
+
+            box_x, box_y, box_width, box_height = self._bounding_box
+
             if horizontal:  # horizontal orientation, add left and right arrows
                 if (
                     (arrow_width is not None)
                     and (arrow_height is not None)
                     and (arrow_width > 0)
                 ):
-                    mid_point_y = self._bounding_box[1] + self._bounding_box[3] // 2
-                    self.append(
-                        Triangle(
-                            self._bounding_box[0] - self._arrow_gap,
-                            mid_point_y - arrow_height // 2,
-                            self._bounding_box[0] - self._arrow_gap,
-                            mid_point_y + arrow_height // 2,
-                            self._bounding_box[0] - self._arrow_gap - arrow_width,
-                            mid_point_y,
-                            fill=arrow_color,
-                            outline=arrow_outline,
-                        )
+                    mid_point_y = box_y + box_height // 2
+                    base_x = box_x - self._arrow_gap
+                    arrow = Triangle(
+                        base_x,
+                        mid_point_y - arrow_height // 2,
+                        base_x,
+                        mid_point_y + arrow_height // 2,
+                        base_x - arrow_width,
+                        mid_point_y,
+                        fill=arrow_color,
+                        outline=arrow_outline,
                     )
-
-                    self.append(
-                        Triangle(
-                            self._bounding_box[0]
-                            + self._bounding_box[2]
-                            + self._arrow_gap,
-                            mid_point_y - arrow_height // 2,
-                            self._bounding_box[0]
-                            + self._bounding_box[2]
-                            + self._arrow_gap,
-                            mid_point_y + arrow_height // 2,
-                            self._bounding_box[0]
-                            + self._bounding_box[2]
-                            + self._arrow_gap
-                            + arrow_width,
-                            mid_point_y,
-                            fill=arrow_color,
-                            outline=arrow_outline,
-                        )
+                    self.append(arrow)
+
+                    # the right arrow is the left arrow mirrored across the center
+                    # of the bounding box, sharing its bitmap
+                    mirrored_arrow = displayio.TileGrid(
+                        arrow.bitmap,
+                        pixel_shader=arrow.pixel_shader,
+                        x=2 * box_x + box_width + 1 - arrow.x - arrow.bitmap.width,
+                        y=arrow.y,
                     )
+                    mirrored_arrow.flip_x = True
+                    self.append(mirrored_arrow)
             else:  # vertical orientation, add upper and lower arrows
                 if (
                     (arrow_height is not None)
                     and (arrow_width is not None)
                     and (arrow_height > 0)
                 ):
-                    mid_point_x = self._bounding_box[0] + self._bounding_box[2] // 2
-                    self.append(
-                        Triangle(
-                            mid_point_x - arrow_width // 2,
-                            self._bounding_box[1] - self._arrow_gap,
-                            mid_point_x + arrow_width // 2,
-                            self._bounding_box[1] - self._arrow_gap,
-                            mid_point_x,
-                            self._bounding_box[1] - self._arrow_gap - arrow_height,
-                            fill=arrow_color,
-                            outline=arrow_outline,
-                        )
+                    mid_point_x = box_x + box_width // 2
+                    base_y = box_y - self._arrow_gap
+                    arrow = Triangle(
+                        mid_point_x - arrow_width // 2,
+                        base_y,
+                        mid_point_x + arrow_width // 2,
+                        base_y,
+                        mid_point_x,
+                        base_y - arrow_height,
+                        fill=arrow_color,
+                        outline=arrow_outline,
                     )
-                    self.append(
-                        Triangle(
-                            mid_point_x - arrow_width // 2,
-                            self._bounding_box[1]
-                            + self._bounding_box[3]
-                            + self._arrow_gap,
-                            mid_point_x + arrow_width // 2,
-                            self._bounding_box[1]
-                            + self._bounding_box[3]
-                            + self._arrow_gap,
-                            mid_point_x,
-                            self._bounding_box[1]
-                            + self._bounding_box[3]
-                            + self._arrow_gap
-                            + arrow_height,
-                            fill=arrow_color,
-                            outline=arrow_outline,
-                        )
+                    self.append(arrow)
+
+                    # the lower arrow is the upper arrow mirrored across the center
+                    # of the bounding box, sharing its bitmap
+                    mirrored_arrow = displayio.TileGrid(
+                        arrow.bitmap,
+                        pixel_shader=arrow.pixel_shader,
+                        x=arrow.x,
+                        y=2 * box_y + box_height + 1 - arrow.y - arrow.bitmap.height,
                     )
+                    mirrored_arrow.flip_y = True
+                    self.append(mirrored_arrow)
 
     # Draw function to update the current value
     def _update_value(self, new_value: int, animate: bool = True) -> None:
-        if (
-            (self._animation_time is not None)
-            and (self._animation_time > 0)  # If animation is required
-            and (animate)
-        ):
+        if new_value == self._value:  # nothing to redraw
+            return
+
+        if self._animated and animate:  # If animation is required
+            # render the new value into the spare bitmap
+            old_bitmap = self._value_bitmap
+            new_bitmap = self._spare_bitmap
+            self._render_value(new_value, new_bitmap)
+
             if ((new_value - self.value) == 1) or (
-                (self.value == (len(self.value_list) - 1)) and (new_value == 0)
+                (self.value == (self._value_count - 1)) and (new_value == 0)
             ):  # wrap around
-                start_position = 0.0
-                end_position = 1.0
+                # scroll forward, from the old value at 0.0 to the new value at 1.0
+                positions = self._next_positions
+                bitmap1 = old_bitmap
+                bitmap2 = new_bitmap
             else:
-                start_position = 1.0
-                end_position = 0.0
+                # scroll backward, from the old value at 1.0 to the new value at 0.0
+                positions = self._previous_positions
+                bitmap1 = new_bitmap
+                bitmap2 = old_bitmap
 
+            # display the animation bitmap in place of the value bitmap, holding
+            # off refreshes until _animate_bitmap has drawn its first frame
             self._display.auto_refresh = False
-
-            gc.collect()
-
-            # create the animation bitmap
-            animation_bitmap = displayio.Bitmap(
-                self._bounding_box[2] // self._font_scale,
-                self._bounding_box[3] // self._font_scale,
-                2,
-            )  # color depth 2
-
-            palette = displayio.Palette(2)
-            palette.make_transparent(0)
-            palette[1] = self._color
-            animation_tilegrid = displayio.TileGrid(
-                animation_bitmap, pixel_shader=palette
-            )
-
-            # add bitmap to the animation_group
-            self._animation_group.append(animation_tilegrid)
-
-            # store away the initial starting bitmap
-            start_bitmap = displayio.Bitmap(
-                self._label.bitmap.width, self._label.bitmap.height, 2
-            )  # color depth 2
-            start_bitmap.blit(0, 0, self._label.bitmap)
-
-            # get the bitmap1 position offsets
-            bitmap1_offset = (
-                -1 * self._left + self._label.tilegrid.x,
-                -1 * self._top + self._label.tilegrid.y,
-            )
-
-            # hide the label group
-            self.pop(0)
-
-            # update the value label and get the bitmap offsets
-            self._label.text = str(self.value_list[new_value])
-            bitmap2_offset = (
-                -1 * self._left + self._label.tilegrid.x,
-                -1 * self._top + self._label.tilegrid.y,
-            )
+            self._value_tilegrid.bitmap = self._animation_bitmap
 
             # animate between old and new bitmaps
             _animate_bitmap(
                 display=self._display,
-                target_bitmap=animation_bitmap,
-                bitmap1=start_bitmap,
-                bitmap1_offset=bitmap1_offset,
-                bitmap2=self._label.bitmap,
-                bitmap2_offset=bitmap2_offset,
-                start_position=start_position,
-                end_position=end_position,
+                target_bitmap=self._animation_bitmap,
+                bitmap1=bitmap1,
+                bitmap1_offset=(0, 0),
+                bitmap2=bitmap2,
+                bitmap2_offset=(0, 0),
+                positions=positions,
                 animation_time=self._animation_time,
                 horizontal=self._horizontal,
             )
 
-            # unhide the label group
-            self.insert(0, self._label)
-
-            # hide the animation group
-            self._animation_group.pop()
-            # free up memory
-            del animation_bitmap
-            del start_bitmap
-            gc.collect()
-
-            # ensure the display will auto_refresh (likely redundant)
-            self._display.auto_refresh = True
+            # show the new value, the old bitmap is reused for the next flip
+            self._value_bitmap = new_bitmap
+            self._spare_bitmap = old_bitmap
+            self._value_tilegrid.bitmap = new_bitmap
 
         else:  # Update with no animation
-            self._display.auto_refresh = False
-            self._label.text = str(self.value_list[new_value])
-            self._display.auto_refresh = True
+            self._render_value(new_value, self._value_bitmap)
         self._update_position()  # call Widget superclass function to reposition
 
+    # Draws value_list[index] into the value bitmap, clearing the rest of it
+    def _render_value(self, index: int, value_bitmap: displayio.Bitmap) -> None:
+        text = str(self.value_list[index])
+        covered = None
+        if text:  # an empty string has no label bitmap to copy
+            label = bitmap_label.Label(
+                text=text,
+                font=self._font,
+                base_alignment=True,
+                background_tight=True,
+            )
+            covered = _blit_constrained(
+                value_bitmap,
+                -1 * self._left + label.tilegrid.x,
+                -1 * self._top + label.tilegrid.y,
+                label.bitmap,
+            )
+        _clear_uncovered(
+            value_bitmap, 0, 0, value_bitmap.width, value_bitmap.height, covered
+        )
+
+    # Caches the start, midpoint and end of the touch_boundary along the flip
+    # direction, used by ``selected`` to pick the half that was touched
+    def _split_touch_boundary(self) -> None:
+        t_b = self.touch_boundary
+        if self._horizontal:
+            start, length = t_b[0], t_b[2]
+        else:
+            start, length = t_b[1], t_b[3]
+        self._touch_split = (start, start + length // 2, start + length)
+        self._touch_split_boundary = t_b
+
     def _ok_to_change(self) -> bool:  # checks state variable and timers to determine
         # if an update is allowed
         if self._cool_down < 0:  # if cool_down is negative, require ``released``
             # to be called before next change
             return not self._pressed
-        if (time.monotonic() - self._last_pressed) < self._cool_down:
+        if (_monotonic() - self._last_pressed) < self._cool_down:
             return False  # cool_down time has not transpired
         return True
 
@@ -466,37 +480,38 @@ class FlipInput(Widget, Control):
         # Adjust for local position of the widget using self.x and self.y
 
         if self._ok_to_change():
-            t_b = self.touch_boundary
+            if self.touch_boundary is not self._touch_split_boundary:
+                self._split_touch_boundary()  # touch_boundary was replaced
+            touch_start, touch_mid, touch_end = self._touch_split
 
+            step = 0
             if self._horizontal:
-                if (
-                    t_b[0] <= (touch_point[0] - self.x) < (t_b[0] + t_b[2] // 2)
-                ):  # in left half of touch_boundary
-                    self.value = self.value - 1
+                touch_x = touch_point[0] - self.x
+                if touch_start <= touch_x < touch_mid:
+                    # in left half of touch_boundary
+                    step = -1
 
-                elif (
-                    (t_b[0] + t_b[2] // 2)
-                    <= (touch_point[0] - self.x)
-                    <= (t_b[0] + t_b[2])
-                ):  # in right half of touch_boundary
-                    self.value = self.value + 1
+                elif touch_mid <= touch_x <= touch_end:
+                    # in right half of touch_boundary
+                    step = 1
 
             else:
-                if (
-                    t_b[1] <= (touch_point[1] - self.y) < (t_b[1] + t_b[3] // 2)
-                ):  # in upper half of touch_boundary
-                    self.value = self.value + 1
+                touch_y = touch_point[1] - self.y
+                if touch_start <= touch_y < touch_mid:
+                    # in upper half of touch_boundary
+                    step = 1
 
-                elif (
-                    (t_b[1] + t_b[3] // 2)
-                    <= (touch_point[1] - self.y)
-                    <= (t_b[1] + t_b[3])
-                ):  # in lower half of touch_boundary
-                    self.value = self.value - 1
+                elif touch_mid <= touch_y <= touch_end:
+                    # in lower half of touch_boundary
+                    step = -1
+
+            new_value = (self._value + step) % self._value_count
+            if new_value != self._value:
+                self.value = new_value
 
             self._pressed = True  # update the state variable
             self._last_pressed = (
-                time.monotonic()
+                _monotonic()
             )  # value changed, so update cool_down timer
 
     def released(self) -> None:
@@ -530,7 +545,7 @@ class FlipInput(Widget, Control):
                 )
                 return None
 
-        new_value = new_value % len(self.value_list)  # Update the value
+        new_value = new_value % self._value_count  # Update the value
         if new_value != self._value:
             self._update_value(new_value)
             self._value = new_value
@@ -548,51 +563,139 @@ def _draw_position(
     position: float = 0.0,
     horizontal: bool = True,
 ) -> None:
-    x_offset1 = bitmap1_offset[0]
-    y_offset1 = bitmap1_offset[1]
-    x_offset2 = bitmap2_offset[0]
-    y_offset2 = bitmap2_offset[1]
+    x_offset1, y_offset1 = bitmap1_offset
+    x_offset2, y_offset2 = bitmap2_offset
+
+    width = target_bitmap.width
+    height = target_bitmap.height
 
+    # Rather than clearing the whole target first, only the pixels left uncovered
+    # by a blit are cleared.
     if position == 0.0:
-        target_bitmap.fill(0)
-        target_bitmap.blit(x_offset1, y_offset1, bitmap1)
+        covered = _blit_rect(
+            target_bitmap,
+            x_offset1,
+            y_offset1,
+            bitmap1,
+            0,
+            0,
+            bitmap1.width,
+            bitmap1.height,
+        )
+        _clear_uncovered(target_bitmap, 0, 0, width, height, covered)
         return
     if position == 1.0:
-        target_bitmap.fill(0)
-        target_bitmap.blit(x_offset2, y_offset2, bitmap2)
+        covered = _blit_rect(
+            target_bitmap,
+            x_offset2,
+            y_offset2,
+            bitmap2,
+            0,
+            0,
+            bitmap2.width,
+            bitmap2.height,
+        )
+        _clear_uncovered(target_bitmap, 0, 0, width, height, covered)
         return
 
+    # Each bitmap is confined to its own side of the seam, which is cleared around
+    # it separately.
     if horizontal:
-        target_bitmap.fill(0)  # clear the target bitmap
-        x_index = round(position * target_bitmap.width)  # find the scroll offset
-        _blit_constrained(target_bitmap, x_offset1, y_offset1, bitmap1, x1=x_index)
-        _blit_constrained(
+        # find the scroll offset, rounded half away from zero
+        if position >= 0:
+            x_index = int(position * width + 0.5)
+        else:
+            x_index = -int(0.5 - position * width)
+        seam = min(max(width - x_index, 0), width)
+        covered = _blit_rect(
+            target_bitmap,
+            x_offset1,
+            y_offset1,
+            bitmap1,
+            x_index,
+            0,
+            bitmap1.width,
+            bitmap1.height,
+        )
+        _clear_uncovered(target_bitmap, 0, 0, seam, height, covered)
+        covered = _blit_rect(
             target_bitmap,
-            target_bitmap.width - x_index + x_offset2,
+            width - x_index + x_offset2,
             y_offset2,
             bitmap2,
-            x1=0,
-            x2=x_index,
+            0,
+            0,
+            x_index,
+            bitmap2.height,
         )
+        _clear_uncovered(target_bitmap, seam, 0, width, height, covered)
 
     else:
-        target_bitmap.fill(0)
-        y_index = round(position * target_bitmap.height)
-
-        _blit_constrained(target_bitmap, x_offset1, y_offset1, bitmap1, y1=y_index)
-        _blit_constrained(
+        if position >= 0:
+            y_index = int(position * height + 0.5)
+        else:
+            y_index = -int(0.5 - position * height)
+        seam = min(max(height - y_index, 0), height)
+        covered = _blit_rect(
+            target_bitmap,
+            x_offset1,
+            y_offset1,
+            bitmap1,
+            0,
+            y_index,
+            bitmap1.width,
+            bitmap1.height,
+        )
+        _clear_uncovered(target_bitmap, 0, 0, width, seam, covered)
+        covered = _blit_rect(
             target_bitmap,
             x_offset2,
-            target_bitmap.height - y_index + y_offset2,
+            height - y_index + y_offset2,
             bitmap2,
-            y1=0,
-            y2=y_index,
+            0,
+            0,
+            bitmap2.width,
+            y_index,
         )
+        _clear_uncovered(target_bitmap, 0, seam, width, height, covered)
 
 
 # pylint: disable=invalid-name
 
 
+# _clear_uncovered: Clears the (x1, y1)-(x2, y2) region of the target, except for
+# the covered rectangle returned by _blit_rect
+def _clear_uncovered(
+    target: displayio.Bitmap,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    covered: Optional[Tuple[int, int, int, int]],
+) -> None:
+    if (x1 >= x2) or (y1 >= y2):
+        return
+    if covered is None:
+        bitmaptools.fill_region(target, x1, y1, x2, y2, 0)
+        return
+
+    # clamp the covered rectangle into the region
+    left = min(max(covered[0], x1), x2)
+    top = min(max(covered[1], y1), y2)
+    right = min(max(covered[2], left), x2)
+    bottom = min(max(covered[3], top), y2)
+
+    if top > y1:  # strip above
+        bitmaptools.fill_region(target, x1, y1, x2, top, 0)
+    if bottom < y2:  # strip below
+        bitmaptools.fill_region(target, x1, bottom, x2, y2, 0)
+    if bottom > top:
+        if left > x1:  # strip to the left
+            bitmaptools.fill_region(target, x1, top, left, bottom, 0)
+        if right < x2:  # strip to the right
+            bitmaptools.fill_region(target, right, top, x2, bottom, 0)
+
+
 # _blit_constrained: Copies bitmaps with constraints to the dimensions
 def _blit_constrained(
     target: displayio.Bitmap,
@@ -603,7 +706,7 @@ def _blit_constrained(
     y1: Optional[int] = None,
     x2: Optional[int] = None,
     y2: Optional[int] = None,
-) -> None:
+) -> Optional[Tuple[int, int, int, int]]:
     if x1 is None:
         x1 = 0
     if y1 is None:
@@ -613,38 +716,72 @@ def _blit_constrained(
     if y2 is None:
         y2 = source.height
 
-    if x < 0:
-        x1 -= x  # offset the clip region in positive direction
-        x2 -= x
-        x = 0
-    if x1 < 0:
-        x = x - x1
-        x1 = 0  # move to origin
-    if x2 > source.width:
-        x2 = source.width
+    return _blit_rect(target, x, y, source, x1, y1, x2, y2)
 
-    if y < 0:
-        y1 -= y  # offset the clip region
-        y2 -= y
-        y = 0
-    if y1 < 0:
-        y = y - y1
-        y1 = 0
-    if y2 > source.height:
-        y2 = source.height
 
-    if (
-        (x > target.width)
-        or (y > target.height)
-        or (x1 > source.width)
-        or (y1 > source.height)
-    ):
-        return
+# _blit_rect: Copies the (x1, y1)-(x2, y2) rectangle of the source bitmap, clipped
+# to the dimensions of both bitmaps. Returns the (left, top, right, bottom)
+# rectangle of the target that was drawn, or None if nothing was drawn
+def _blit_rect(
+    target: displayio.Bitmap,
+    x: int,
+    y: int,
+    source: displayio.Bitmap,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+) -> Optional[Tuple[int, int, int, int]]:
+    # shift the clip region to keep the target position on the target...
+    shift = -min(x, 0)
+    x, x1, x2 = x + shift, x1 + shift, x2 + shift
+    # ...then shift the target position to keep the clip region on the source
+    shift = -min(x1, 0)
+    x, x1 = x + shift, x1 + shift
+    x2 = min(x2, source.width)
+
+    shift = -min(y, 0)
+    y, y1, y2 = y + shift, y1 + shift, y2 + shift
+    shift = -min(y1, 0)
+    y, y1 = y + shift, y1 + shift
+    y2 = min(y2, source.height)
+
+    if (x2 <= x1) or (y2 <= y1) or (x >= target.width) or (y >= target.height):
+        return None  # nothing to draw
 
     target.blit(x, y, source, x1=x1, y1=y1, x2=x2, y2=y2)
 
+    return (
+        x,
+        y,
+        min(x + x2 - x1, target.width),
+        min(y + y2 - y1, target.height),
+    )
+
 
-# _animate_bitmap - performs animation of scrolling between two bitmaps
+# _eased_positions - precomputes the eased scroll position of each animation frame
+def _eased_positions(
+    start_position: float, end_position: float, animation_time: float
+) -> List[float]:
+    if start_position > end_position:  # direction is decreasing: "out"
+        easing_function = easeout  # use the "out" easing function
+    else:  # direction is increasing: "in"
+        easing_function = easein  # use the "in" easing function
+
+    frame_count = max(4, int(animation_time * _TARGET_FPS))
+    last_frame = frame_count - 1
+    positions = [
+        easing_function(
+            start_position + (end_position - start_position) * frame / last_frame
+        )
+        for frame in range(frame_count)
+    ]
+    positions[last_frame] = end_position  # always finish at the end position
+    return positions
+
+
+# _animate_bitmap - performs animation of scrolling between two bitmaps, drawing
+# each of the precomputed positions in its time slot
 def _animate_bitmap(
     display: displayio.Display,
     target_bitmap: displayio.Bitmap,
@@ -652,66 +789,38 @@ def _animate_bitmap(
     bitmap1_offset: Tuple[int, int],
     bitmap2: displayio.Bitmap,
     bitmap2_offset: Tuple[int, int],
-    start_position: float,
-    end_position: float,
+    positions: List[float],
     animation_time: float,
     horizontal: bool,
 ) -> None:
-    start_time = time.monotonic()
-
-    if start_position > end_position:  # direction is decreasing: "out"
-        [bitmap2, bitmap1] = [bitmap1, bitmap2]
-        [bitmap2_offset, bitmap1_offset] = [bitmap1_offset, bitmap2_offset]
-        easing_function = easeout  # use the "out" easing function
-
-    else:  # direction is increasing: "in"
-        easing_function = easein  # use the "in" easing function
-
-    display.auto_refresh = False
-    _draw_position(
-        target_bitmap,
-        bitmap1,
-        bitmap1_offset,
-        bitmap2,
-        bitmap2_offset,
-        position=start_position,
-        horizontal=horizontal,
-    )
-    display.auto_refresh = True
-
-    while True:
-        this_time = time.monotonic()
-        target_position = (
-            start_position
-            + (end_position - start_position)
-            * (this_time - start_time)
-            / animation_time
+    last_frame = len(positions) - 1
+    frame_interval = animation_time / last_frame
+
+    # bind the per-frame callables to locals to skip repeated lookups
+    monotonic = _monotonic
+    sleep = time.sleep
+    draw_position = _draw_position
+    refresh = display.refresh
+
+    display.auto_refresh = False  # frames are refreshed explicitly below
+    start_time = monotonic()
+
+    for frame, position in enumerate(positions):
+        frame_time = start_time + frame * frame_interval
+        this_time = monotonic()
+        if this_time < frame_time:  # wait for this frame's time slot
+            sleep(frame_time - this_time)
+        elif (frame < last_frame) and (this_time > frame_time + frame_interval):
+            continue  # running late, drop this frame to keep the animation speed
+
+        draw_position(
+            target_bitmap,
+            bitmap1,
+            bitmap1_offset,
+            bitmap2,
+            bitmap2_offset,
+            position,
+            horizontal,
         )
-
-        display.auto_refresh = False
-        if (this_time - start_time) < animation_time:
-            display.auto_refresh = False
-            _draw_position(
-                target_bitmap,
-                bitmap1,
-                bitmap1_offset,
-                bitmap2,
-                bitmap2_offset,
-                position=easing_function(target_position),
-                horizontal=horizontal,
-            )
-            display.auto_refresh = True
-        else:
-            _draw_position(
-                target_bitmap,
-                bitmap1,
-                bitmap1_offset,
-                bitmap2,
-                bitmap2_offset,
-                position=end_position,
-                horizontal=horizontal,
-            )
-
-            break
-        display.auto_refresh = True
+        refresh()
     display.auto_refresh = True